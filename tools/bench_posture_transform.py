@@ -0,0 +1,140 @@
+import math
+import random
+import argparse
+import timeit
+
+from run_demo import (
+    CLAMP_MIN,
+    CLAMP_MAX,
+    MANIFEST_A_DECIMALS,
+    clamp,
+    posture_u,
+    u_table,
+    alignment_kernel,
+    transform_stats,
+    reset_transform_stats,
+)
+from thread_generator import generate_stress
+
+# ------------------------------------------------------------
+# SSM-TWEET POSTURE TRANSFORM BENCHMARK
+# u = atanh(clamp(a_raw)) — direct vs lookup table vs memo
+#
+# Checks bit-identity against the direct computation (transform and
+# full alignment_kernel), then times the isolated transform and the
+# end-to-end kernel on the stress corpus.
+#
+# Run:
+#   python bench_posture_transform.py --count 20000
+#   python bench_posture_transform.py --check-only   (exit 1 on mismatch)
+# ------------------------------------------------------------
+
+
+def direct_u(a_raw):
+    return math.atanh(clamp(a_raw, CLAMP_MIN, CLAMP_MAX))
+
+
+def check_bit_identity(values, table):
+    """Every value must give the same float bits as the direct path."""
+    for a_raw in values:
+        expected = direct_u(a_raw).hex()
+        if posture_u(a_raw, table).hex() != expected:
+            raise AssertionError(f"table mismatch at a_raw={a_raw!r}")
+        if posture_u(a_raw).hex() != expected:
+            raise AssertionError(f"memo mismatch at a_raw={a_raw!r}")
+
+
+def check_kernel_identity(envelopes):
+    """Cached and direct kernels must produce identical traces and hashes."""
+    cached = alignment_kernel(envelopes)
+    direct = alignment_kernel(envelopes, posture_cache=False)
+    if repr(cached) != repr(direct):
+        raise AssertionError("alignment_kernel output differs from direct path")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SSM-TWEET Posture Transform Benchmark")
+    parser.add_argument("--count", type=int, default=20000,
+                        help="number of stress envelopes")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="timing repetitions (best is reported)")
+    parser.add_argument("--check-only", action="store_true",
+                        help="run the bit-identity checks and skip timing")
+    args = parser.parse_args()
+
+    random.seed(2025)
+    envelopes = generate_stress(args.count)
+    values = [env["a_raw"] for env in envelopes]
+
+    decimals = MANIFEST_A_DECIMALS["T1"]
+    table = u_table(decimals)
+
+    scale = 10 ** decimals
+    grid = [k / scale for k in range(-scale, scale + 1)]
+    check_bit_identity(grid + [-0.0, 0.0, 1.5, -2.0] + values, table)
+
+    # Edge envelopes: signed zero, off-grid value, undeclared manifest
+    edge = [
+        {"sequence_number": args.count + 1, "a_raw": -0.0, "weight": 1.0,
+         "thread_id": "t1", "manifest_id": "T1"},
+        {"sequence_number": args.count + 2, "a_raw": 0.12345, "weight": 1.0,
+         "thread_id": "t2", "manifest_id": "T1"},
+        {"sequence_number": args.count + 3, "a_raw": 0.5, "weight": 1.0,
+         "thread_id": "t3"},
+    ]
+    check_kernel_identity(envelopes + edge)
+
+    if args.check_only:
+        print(f"Bit-identity : OK ({len(grid)} grid points + corpus + kernel)")
+        return
+
+    def run_direct():
+        for a_raw in values:
+            direct_u(a_raw)
+
+    def run_table():
+        for a_raw in values:
+            posture_u(a_raw, table)
+
+    def run_memo():
+        for a_raw in values:
+            posture_u(a_raw)
+
+    def best(fn):
+        return min(timeit.repeat(fn, number=1, repeat=args.repeat))
+
+    t_direct = best(run_direct)
+    t_table = best(run_table)
+    t_memo = best(run_memo)
+
+    # Interleave the two kernels so allocator/cache drift hits both alike
+    k_direct = k_table = float("inf")
+    for _ in range(args.repeat):
+        k_direct = min(k_direct, timeit.timeit(
+            lambda: alignment_kernel(envelopes, posture_cache=False), number=3) / 3)
+        k_table = min(k_table, timeit.timeit(
+            lambda: alignment_kernel(envelopes), number=3) / 3)
+
+    reset_transform_stats()
+    alignment_kernel(envelopes)
+    stats = transform_stats()
+
+    per = 1e9 / len(values)
+    print(f"\n=== SSM-TWEET Posture Transform Benchmark ===")
+    print(f"Envelopes    : {len(values)} (stress, seed 2025)")
+    print(f"Bit-identity : OK ({len(grid)} grid points + corpus + kernel)")
+    print("-- isolated transform --")
+    print(f"direct       : {t_direct * per:8.1f} ns/envelope")
+    print(f"table        : {t_table * per:8.1f} ns/envelope  "
+          f"(x{t_direct / t_table:.2f})")
+    print(f"memo         : {t_memo * per:8.1f} ns/envelope  "
+          f"(x{t_direct / t_memo:.2f})")
+    print("-- alignment_kernel (end to end) --")
+    print(f"direct       : {k_direct * per:8.1f} ns/envelope")
+    print(f"table        : {k_table * per:8.1f} ns/envelope  "
+          f"({(1 - k_table / k_direct):+.1%} time saved)")
+    print(f"Kernel table hit rate : {stats['table_hit_rate']:.1%}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import json
 import math
 import hashlib
+from functools import lru_cache
 
 # ------------------------------------------------------------
 # SSM-TWEET : ADVANCED POC (FULL STRUCTURAL + THREAD + Q-LANE)
@@ -14,6 +15,7 @@ import hashlib
 #   • Multi-thread structural fusion
 #   • Optional ZETA-0 stability events
 #   • Tamper-visible hash chaining
+#   • Manifest-declared quantization → exact atanh lookup tables
 #
 # Canonical envelope example (Overlay Mode):
 # {
@@ -32,9 +34,103 @@ EPS_W = 1e-9
 CLAMP_MIN = -1 + EPS_A
 CLAMP_MAX = +1 - EPS_A
 
+# Declared a_raw quantization per manifest (decimal places).
+# T1 envelopes carry a_raw rounded to 3 decimals (see thread_generator.py).
+MANIFEST_A_DECIMALS = {
+    "T1": 3,
+}
+
+# Bound for the memo used when a manifest declares no quantization.
+U_MEMO_SIZE = 4096
+
 def clamp(x, lo, hi):
     return max(lo, min(hi, x))
 
+
+# ------------------------------------------------------------
+# Posture transform: u = atanh(clamp(a_raw))
+# ------------------------------------------------------------
+_U_TABLES = {}
+_U_TABLE_STATS = {"hits": 0, "misses": 0, "zero_bypass": 0}
+
+
+def u_table(decimals):
+    """
+    Exact lookup table u = atanh(clamp(a_raw)) for a_raw quantized to
+    `decimals` places over [-1, +1].
+
+    Keys are k / 10**decimals, the same float that round(x, decimals) or a
+    JSON literal with that many places produces, so a hit returns the value
+    the direct computation would. Zero is left out so that -0.0 keeps its
+    sign through the direct path in posture_u.
+    """
+    table = _U_TABLES.get(decimals)
+    if table is None:
+        scale = 10 ** decimals
+        table = {}
+        for k in range(-scale, scale + 1):
+            if k == 0:
+                continue
+            a = k / scale
+            table[a] = math.atanh(clamp(a, CLAMP_MIN, CLAMP_MAX))
+        _U_TABLES[decimals] = table
+    return table
+
+
+@lru_cache(maxsize=U_MEMO_SIZE)
+def _u_memo(a_raw):
+    return math.atanh(clamp(a_raw, CLAMP_MIN, CLAMP_MAX))
+
+
+def posture_u(a_raw, table=None):
+    """
+    u = atanh(clamp(a_raw)), bit-identical to the direct computation.
+    Uses `table` (from u_table) when given, then the bounded memo.
+    """
+    if table is not None:
+        u = table.get(a_raw)
+        if u is not None:
+            _U_TABLE_STATS["hits"] += 1
+            return u
+    if a_raw == 0:
+        # 0.0 and -0.0 share a dict key but not an atanh result
+        _U_TABLE_STATS["zero_bypass"] += 1
+        return math.atanh(clamp(a_raw, CLAMP_MIN, CLAMP_MAX))
+    if table is not None:
+        _U_TABLE_STATS["misses"] += 1
+    return _u_memo(a_raw)
+
+
+def transform_stats():
+    """
+    Hit counts for the posture transform (lookup table + memo).
+
+    a_raw == 0 inputs (ZETA-0 and neutral envelopes) take the direct path
+    and are counted only under zero_bypass; table_hit_rate and
+    memo_hit_rate exclude them.
+    """
+    memo = _u_memo.cache_info()
+    table_total = _U_TABLE_STATS["hits"] + _U_TABLE_STATS["misses"]
+    memo_total = memo.hits + memo.misses
+    return {
+        "table_hits": _U_TABLE_STATS["hits"],
+        "table_misses": _U_TABLE_STATS["misses"],
+        "table_hit_rate": _U_TABLE_STATS["hits"] / table_total if table_total else 0.0,
+        "memo_hits": memo.hits,
+        "memo_misses": memo.misses,
+        "memo_size": memo.currsize,
+        "memo_hit_rate": memo.hits / memo_total if memo_total else 0.0,
+        "zero_bypass": _U_TABLE_STATS["zero_bypass"],
+    }
+
+
+def reset_transform_stats():
+    """Clear hit counters and the memo (lookup tables are kept)."""
+    _U_TABLE_STATS["hits"] = 0
+    _U_TABLE_STATS["misses"] = 0
+    _U_TABLE_STATS["zero_bypass"] = 0
+    _u_memo.cache_clear()
+
 def compute_hash(payload: str) -> str:
     """12-char truncated SHA256 for structural tamper visibility."""
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
@@ -57,9 +153,10 @@ def update_quero(previous_q, a_c, prev_a_c):
 # ------------------------------------------------------------
 # UPDATED: Alignment + Quero + ZETA-0 engine
 # ------------------------------------------------------------
-def alignment_kernel(envelopes):
+def alignment_kernel(envelopes, posture_cache=True):
     """
     Core SSM-Tweet structural engine.
+    posture_cache=False computes atanh(clamp(a_raw)) directly (baseline).
     Returns:
         global_trace : evolving global alignment + Quero
         threads      : dict of per-thread posture + Quero
@@ -80,6 +177,14 @@ def alignment_kernel(envelopes):
     prev_hash = "0" * 12
     hash_chain = []
 
+    # ---------- Posture lookup tables (per manifest) ----------
+    # Resolved only when manifest_id changes between envelopes.
+    tables = {}  # manifest_id -> u_table or None
+    manifest = None
+    table = None
+    table_get = None
+    table_hits = 0
+
     for env in envelopes:
         seq = env["sequence_number"]
 
@@ -91,9 +196,25 @@ def alignment_kernel(envelopes):
         # ZETA-0 detection (optional)
         is_z0 = (a_raw == 0.0 and w == 0.0)
 
-        # Clamp posture
-        a_c = clamp(a_raw, CLAMP_MIN, CLAMP_MAX)
-        u = math.atanh(a_c)
+        # Clamp posture: u = atanh(clamp(a_raw)) via declared quantization
+        if not posture_cache:
+            u = math.atanh(clamp(a_raw, CLAMP_MIN, CLAMP_MAX))
+        else:
+            env_manifest = env.get("manifest_id")
+            if env_manifest != manifest:
+                manifest = env_manifest
+                if manifest not in tables:
+                    decimals = MANIFEST_A_DECIMALS.get(manifest)
+                    tables[manifest] = (
+                        u_table(decimals) if decimals is not None else None
+                    )
+                table = tables[manifest]
+                table_get = table.get if table is not None else None
+            u = table_get(a_raw) if table_get is not None else None
+            if u is not None:
+                table_hits += 1
+            else:
+                u = posture_u(a_raw, table)
 
         # ---------- THREAD INIT ----------
         if thread not in threads:
@@ -170,6 +291,8 @@ def alignment_kernel(envelopes):
         hash_chain.append({"seq": seq, "hash": new_hash})
         prev_hash = new_hash
 
+    _U_TABLE_STATS["hits"] += table_hits
+
     return global_trace, threads, hash_chain
 
 
@@ -241,6 +364,14 @@ def main():
 
     print_scoreboard(global_trace, threads)
 
+    stats = transform_stats()
+    print("--- POSTURE TRANSFORM CACHE ------------------------------")
+    print(f"Lookup table hits          : {stats['table_hits']} "
+          f"({stats['table_hit_rate']:.1%})")
+    print(f"Memo hits / misses         : {stats['memo_hits']} / {stats['memo_misses']}")
+    print(f"Zero bypass (direct)       : {stats['zero_bypass']}")
+    print("----------------------------------------------------------\n")
+
     print("--- HASH CHAIN (Structural Integrity) --------------------")
     for h in hash_chain:
         print(f"seq={h['seq']:<4} | hash={h['hash']}")